@@ -38,6 +38,11 @@ NUM_RETURNS = 4
 NUM_SCENES = 4
 NUM_TRACK_PARAMS = 4  # volume + 3 sends
 
+# MIDI identifiers per control group
+ENCODER_CCS = range(ENCODER_CC_START, ENCODER_CC_START + NUM_ENCODERS)
+BUTTON_NOTES = range(BUTTON_NOTE_START, BUTTON_NOTE_START + NUM_ENCODERS)
+LONG_BUTTON_NOTES = range(LONG_BUTTON_NOTE_START, LONG_BUTTON_NOTE_START + NUM_ENCODERS)
+
 
 class EncoderLayout:
     """Named slices for encoder groups."""
@@ -90,25 +95,47 @@ class ToggleSessionComponent(SessionComponent):
 class Grid(ControlSurface):
     def __init__(self, c_instance):
         super().__init__(c_instance)
+        self._pending_track = None
+        self._track_change_scheduled = False
+        self._last_track = None
         with self.component_guard():
+            self._song = self.song()
+            self._master_track = self._song.master_track
+            self._on_return_tracks_changed()
+            self._song.add_return_tracks_listener(self._on_return_tracks_changed)
             self._create_controls()
             self._setup_device()
             self._setup_mixer()
             self._setup_session()
-            self._set_track_controls(self.song().view.selected_track)
+            self._set_track_controls(self._song.view.selected_track)
 
     def disconnect(self):
         self._control_button.remove_value_listener(self._on_control)
+        self._song.remove_return_tracks_listener(self._on_return_tracks_changed)
+        # Release the track encoders and drop the cached tracks
+        with self.component_guard():
+            self._set_track_controls(None)
+        self._pending_track = None
+        self._track_change_scheduled = False
+        self._last_track = None
+        self._master_track = None
+        self._return_tracks = ()
         super().disconnect()
 
+    def _on_return_tracks_changed(self):
+        self._return_tracks = tuple(self._song.return_tracks)
+
     def _create_controls(self):
-        encoder_ccs = range(ENCODER_CC_START, ENCODER_CC_START + NUM_ENCODERS)
-        button_notes = range(BUTTON_NOTE_START, BUTTON_NOTE_START + NUM_ENCODERS)
-        long_button_notes = range(LONG_BUTTON_NOTE_START, LONG_BUTTON_NOTE_START + NUM_ENCODERS)
+        self._encoders = make_controls(make_encoder, "Encoder_%d", ENCODER_CCS)
+        self._buttons = make_controls(make_button, "Button_%d", BUTTON_NOTES)
+        self._long_buttons = make_controls(make_button, "Long_Button_%d", LONG_BUTTON_NOTES)
 
-        self._encoders = make_controls(make_encoder, "Encoder_%d", encoder_ccs)
-        self._buttons = make_controls(make_button, "Button_%d", button_notes)
-        self._long_buttons = make_controls(make_button, "Long_Button_%d", long_button_notes)
+        self._device_encoders = tuple(self._encoders[EncoderLayout.DEVICE])
+        self._track_encoders = tuple(self._encoders[EncoderLayout.TRACK])
+        self._track_select_buttons = tuple(self._buttons[ButtonLayout.TRACK_SELECT])
+        self._return_select_buttons = tuple(self._buttons[ButtonLayout.RETURN_SELECT])
+        self._clip_buttons = tuple(self._buttons[ButtonLayout.CLIP_LAUNCH])
+        self._arm_buttons = tuple(self._long_buttons[ButtonLayout.TRACK_SELECT])
 
         self._control_button = make_button(CONTROL_BUTTON_NOTE, "Control")
         self._control_button.add_value_listener(self._on_control)
@@ -119,21 +146,43 @@ class Grid(ControlSurface):
             self.update()
 
     def _setup_device(self):
-        device_controls = tuple(self._encoders[EncoderLayout.DEVICE])
         device = DeviceComponent()
-        device.set_parameter_controls(device_controls)
+        device.set_parameter_controls(self._device_encoders)
         self.set_device_component(device)
 
     def _on_selected_track_changed(self):
         super()._on_selected_track_changed()
-        track = self.song().view.selected_track
-        if not track:
+        track = self._song.view.selected_track
+        if self._track_change_scheduled:
+            # Coalesce further changes within the tick into one update for the latest track
+            self._pending_track = track
+            return
+        self._track_change_scheduled = True
+        self.schedule_message(1, self._flush_track_change)
+        self._apply_track_change(track)
+
+    def _flush_track_change(self):
+        track = self._pending_track
+        if track is None:
+            self._track_change_scheduled = False
             return
+        self._pending_track = None
+        self.schedule_message(1, self._flush_track_change)
+        self._apply_track_change(track)
 
-        logger.info("Selected track changed: %s", track.name)
-        self._update_device_for_track(track)
-        self._set_track_controls(track)
-        self._update_session_offset(track)
+    def _apply_track_change(self, track):
+        # Selection can settle back on the track that is already applied
+        if not track or track == self._last_track:
+            return
+        self._last_track = track
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Selected track changed: %s", track.name)
+        # Rebind device and encoders under one guard so the MIDI map is rebuilt once
+        with self.component_guard():
+            self._update_device_for_track(track)
+            self._set_track_controls(track)
+            self._update_session_offset(track)
 
     def _update_device_for_track(self, track):
         if not self._device_component:
@@ -141,64 +190,63 @@ class Grid(ControlSurface):
         device = track.view.selected_device
         if not device and track.devices:
             device = track.devices[0]
-            self.song().view.select_device(device)
+            self._song.view.select_device(device)
         self._device_component.set_device(device)
 
+    def _track_index(self, track):
+        """Return the index of track in the song's regular tracks, or -1."""
+        for index, candidate in enumerate(self._song.tracks):
+            if candidate == track:
+                return index
+        return -1
+
     def _update_session_offset(self, track):
-        tracks = list(self.song().tracks)
-        if track in tracks:
-            self._session.set_offsets(tracks.index(track), self._session.scene_offset())
+        index = self._track_index(track)
+        if index >= 0:
+            self._session.set_offsets(index, self._session.scene_offset())
 
     def _setup_session(self):
         self._session = ToggleSessionComponent(num_tracks=1, num_scenes=NUM_SCENES)
         self._session.set_offsets(0, 0)
-        clip_buttons = self._buttons[ButtonLayout.CLIP_LAUNCH]
-        matrix = ButtonMatrixElement(rows=[[b] for b in clip_buttons])
+        matrix = ButtonMatrixElement(rows=[[b] for b in self._clip_buttons])
         self._session.set_clip_launch_buttons(matrix)
 
     def _is_armable_track(self, track):
         """Check if track is a regular track (not master or return)."""
-        if not track:
-            return False
-        if track == self.song().master_track:
-            return False
-        if track in self.song().return_tracks:
-            return False
-        return True
+        return bool(track) and track != self._master_track and track not in self._return_tracks
 
     def _set_track_controls(self, track):
-        track_encoders = self._encoders[EncoderLayout.TRACK]
-
-        # Always release all track encoders first
-        for encoder in track_encoders:
-            encoder.release_parameter()
-
-        if not self._is_armable_track(track):
+        volume, sends = None, ()
+        if self._is_armable_track(track):
+            mixer = track.mixer_device
+            volume, sends = mixer.volume, mixer.sends
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Track controls: %s (volume + %d sends)", track.name, min(len(sends), NUM_TRACK_PARAMS - 1))
+
+        # Map in reverse order (volume on last encoder), release encoders left without a parameter
+        encoders = reversed(self._track_encoders)
+        self._connect_track_encoder(next(encoders), volume)
+        params = iter(sends)
+        for encoder in encoders:
+            self._connect_track_encoder(encoder, next(params, None))
+
+    def _connect_track_encoder(self, encoder, param):
+        """Bind a track encoder to param, skipping the rebind if it is already connected."""
+        if param == encoder.mapped_parameter():
             return
-
-        mixer = track.mixer_device
-        sends = list(mixer.sends[: NUM_TRACK_PARAMS - 1])
-        params = [mixer.volume] + sends
-
-        logger.info("Track controls: %s (volume + %d sends)", track.name, len(sends))
-
-        # Map in reverse order (volume on last encoder)
-        for i, param in enumerate(params):
-            encoder_index = len(track_encoders) - 1 - i
-            if encoder_index >= 0:
-                track_encoders[encoder_index].connect_to(param)
+        if param is None:
+            encoder.release_parameter()
+        else:
+            encoder.connect_to(param)
 
     def _setup_mixer(self):
         self._mixer = MixerComponent(NUM_TRACKS, NUM_RETURNS)
 
-        track_buttons = self._buttons[ButtonLayout.TRACK_SELECT]
-        arm_buttons = self._long_buttons[ButtonLayout.TRACK_SELECT]
         for i in range(NUM_TRACKS):
             strip = self._mixer.channel_strip(i)
-            strip.set_select_button(track_buttons[i])
-            strip.set_arm_button(arm_buttons[i])
+            strip.set_select_button(self._track_select_buttons[i])
+            strip.set_arm_button(self._arm_buttons[i])
 
-        return_buttons = self._buttons[ButtonLayout.RETURN_SELECT]
         for i in range(NUM_RETURNS):
             strip = self._mixer.return_strip(i)
-            strip.set_select_button(return_buttons[i])
+            strip.set_select_button(self._return_select_buttons[i])